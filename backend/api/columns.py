@@ -1,12 +1,70 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from typing import Dict, Any
+import orjson
 
 from ..utils import get_available_columns
 
 router = APIRouter(prefix="/api/columns", tags=["columns"])
 
+def build_columns_payload() -> Dict[str, Any]:
+    """Build the full column metadata payload"""
+    columns = get_available_columns()
+    
+    # Categorize columns for better frontend UX
+    categories = {
+        "basic": [
+            "id", "name", "username", "email", "phone", "website"
+        ],
+        "address": [
+            "address.street", "address.suite", "address.city", 
+            "address.zipcode", "address.geo.lat", "address.geo.lng"
+        ],
+        "company": [
+            "company.name", "company.catchPhrase", "company.bs"
+        ]
+    }
+    
+    return {
+        "columns": columns,
+        "total": len(columns),
+        "categories": categories,
+        "description": "Available columns for data selection"
+    }
+
+def build_category_payload(category: str, columns: Dict[str, str]) -> Dict[str, Any]:
+    """Build the column metadata payload for a single category"""
+    return {
+        "columns": columns,
+        "total": len(columns),
+        "category": category
+    }
+
+# Column metadata never changes, so each response body is serialized once at import
+_COLUMNS_BYTES = orjson.dumps(build_columns_payload())
+_BASIC_COLUMNS_BYTES = orjson.dumps(build_category_payload("basic", {
+    "id": "User ID",
+    "name": "Full Name", 
+    "username": "Username",
+    "email": "Email Address",
+    "phone": "Phone Number",
+    "website": "Website"
+}))
+_ADDRESS_COLUMNS_BYTES = orjson.dumps(build_category_payload("address", {
+    "address.street": "Street Address",
+    "address.suite": "Suite/Apartment",
+    "address.city": "City",
+    "address.zipcode": "ZIP Code",
+    "address.geo.lat": "Latitude",
+    "address.geo.lng": "Longitude"
+}))
+_COMPANY_COLUMNS_BYTES = orjson.dumps(build_category_payload("company", {
+    "company.name": "Company Name",
+    "company.catchPhrase": "Company Slogan",
+    "company.bs": "Business Strategy"
+}))
+
 @router.get("/")
-async def get_available_columns_endpoint() -> Dict[str, Any]:
+async def get_available_columns_endpoint() -> Response:
     """
     Get list of all available columns for frontend selection
     
@@ -32,76 +90,19 @@ async def get_available_columns_endpoint() -> Dict[str, Any]:
     }
     ```
     """
-    columns = get_available_columns()
-    
-    # Categorize columns for better frontend UX
-    categories = {
-        "basic": [
-            "id", "name", "username", "email", "phone", "website"
-        ],
-        "address": [
-            "address.street", "address.suite", "address.city", 
-            "address.zipcode", "address.geo.lat", "address.geo.lng"
-        ],
-        "company": [
-            "company.name", "company.catchPhrase", "company.bs"
-        ]
-    }
-    
-    return {
-        "columns": columns,
-        "total": len(columns),
-        "categories": categories,
-        "description": "Available columns for data selection"
-    }
+    return Response(content=_COLUMNS_BYTES, media_type="application/json")
 
 @router.get("/basic")
-async def get_basic_columns() -> Dict[str, Any]:
+async def get_basic_columns() -> Response:
     """Get only basic user columns (id, name, email, etc.)"""
-    basic_columns = {
-        "id": "User ID",
-        "name": "Full Name", 
-        "username": "Username",
-        "email": "Email Address",
-        "phone": "Phone Number",
-        "website": "Website"
-    }
-    
-    return {
-        "columns": basic_columns,
-        "total": len(basic_columns),
-        "category": "basic"
-    }
+    return Response(content=_BASIC_COLUMNS_BYTES, media_type="application/json")
 
 @router.get("/address")
-async def get_address_columns() -> Dict[str, Any]:
+async def get_address_columns() -> Response:
     """Get only address-related columns"""
-    address_columns = {
-        "address.street": "Street Address",
-        "address.suite": "Suite/Apartment",
-        "address.city": "City",
-        "address.zipcode": "ZIP Code",
-        "address.geo.lat": "Latitude",
-        "address.geo.lng": "Longitude"
-    }
-    
-    return {
-        "columns": address_columns,
-        "total": len(address_columns),
-        "category": "address"
-    }
+    return Response(content=_ADDRESS_COLUMNS_BYTES, media_type="application/json")
 
 @router.get("/company")
-async def get_company_columns() -> Dict[str, Any]:
+async def get_company_columns() -> Response:
     """Get only company-related columns"""
-    company_columns = {
-        "company.name": "Company Name",
-        "company.catchPhrase": "Company Slogan",
-        "company.bs": "Business Strategy"
-    }
-    
-    return {
-        "columns": company_columns,
-        "total": len(company_columns),
-        "category": "company"
-    }
+    return Response(content=_COMPANY_COLUMNS_BYTES, media_type="application/json")
@@ -1,280 +1,453 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional, Dict, Any
-import json
-from pathlib import Path
+from fastapi import APIRouter, HTTPException, Query, Header, Depends, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Set, Tuple
+from functools import lru_cache
+from bisect import bisect_right
+import re
+import orjson
 from datetime import datetime
 
 from ..models import (
     User, FlexibleDataResponse, ColumnSelection, DataRequest
 )
-from ..utils import select_columns, get_available_columns, flatten_user_data
+from ..utils import make_row_projector, get_available_columns, flatten_user_data
+from ..data_store import get_users
+from ..caching import make_etag, cached_json_response
 
 router = APIRouter(prefix="/api/data", tags=["data"])
 
-# Load data from JSON file
-def load_data() -> List[Dict[str, Any]]:
-    """Load data from the JSON file"""
+def get_nested_value(obj: Dict[str, Any], path: str):
+    """Resolve a dotted path (e.g. 'address.geo.lat') against a nested dict"""
     try:
-        # Get the path to the data.json file
-        current_dir = Path(__file__).parent.parent.parent
-        data_file = current_dir / "dummy_db" / "data.json"
-        
-        with open(data_file, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
-    except FileNotFoundError:
-        raise HTTPException(status_code=500, detail="Data file not found")
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=500, detail="Invalid JSON data")
-
-# In-memory cache (loads once at startup)
-users_data = load_data()
-
-@router.get("/", response_model=FlexibleDataResponse)
-async def get_flexible_data(
-    columns: Optional[str] = Query(None, description="Comma-separated list of columns (e.g., 'id,name,email' or 'id,name,address.city')"),
-    page: Optional[int] = Query(None, ge=1, description="Page number (1-based)"),
-    limit: Optional[int] = Query(None, ge=1, le=100, description="Items per page"),
-    search: Optional[str] = Query(None, description="Search term to filter across all fields"),
-    filters: Optional[str] = Query(None, description="Comma-separated column filters in the form key:value (e.g., 'id:5,company.name:tech')"),
-    sort_by: Optional[str] = Query(None, description="Field to sort by (e.g., 'name', 'city', 'company.name')"),
-    sort_order: Optional[str] = Query("asc", pattern="^(asc|desc)$", description="Sort order: 'asc' or 'desc'"),
-    format: Optional[str] = Query("nested", pattern="^(nested|flat)$", description="Response format: 'nested' (preserves structure) or 'flat' (flattened)")
-) -> FlexibleDataResponse:
-    """
-    Get user data with flexible column selection and filtering
+        current = obj
+        for part in path.split('.'):
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                return None
+        return current
+    except Exception:
+        return None
+
+def build_columns(data: List[Dict[str, Any]], flat_rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Build a column-oriented view of the data: one list per column, aligned by row index"""
+    flat_keys = dict.fromkeys(key for row in flat_rows for key in row)
     
-    **Examples:**
-    - All data: `/api/data/`
-    - Basic info: `/api/data/?columns=id,name,email`
-    - Address only: `/api/data/?columns=id,name,address.street,address.city`
-    - Company info: `/api/data/?columns=id,name,company.name,company.catchPhrase`
-    - Flat format: `/api/data/?columns=id,name,city,company_name&format=flat`
-    - Search: `/api/data/?search=john&columns=id,name,email`
-    - Paginated: `/api/data/?columns=id,name,email&page=1&limit=10`
-    """
+    # Flat keys (e.g. 'city', 'company_name')
+    columns = {key: [row.get(key) for row in flat_rows] for key in flat_keys}
     
-    filtered_data = users_data.copy()
+    # Dotted keys (e.g. 'address.city', 'company.name')
+    for path in get_available_columns():
+        if '.' in path:
+            columns[path] = [get_nested_value(user, path) for user in data]
+    
+    return columns
+
+def build_inverted_index(values: List[Any], normalize) -> Dict[Any, List[int]]:
+    """Map each normalized, non-null column value to the row indexes holding it"""
+    index: Dict[Any, List[int]] = {}
+    for i, value in enumerate(values):
+        if value is not None:
+            index.setdefault(normalize(value), []).append(i)
+    return index
+
+def as_int(value):
+    """Convert a value to int when possible (mirrors the id special case in filters)"""
+    try:
+        return int(value)
+    except Exception:
+        return value
+
+# Lowercased text of each field used by search and sorting
+TEXT_FIELDS = {
+    'id': lambda user: user.get('id', ''),
+    'name': lambda user: user.get('name', ''),
+    'username': lambda user: user.get('username', ''),
+    'email': lambda user: user.get('email', ''),
+    'phone': lambda user: user.get('phone', ''),
+    'website': lambda user: user.get('website', ''),
+    'address.city': lambda user: (user.get('address') or {}).get('city', ''),
+    'address.street': lambda user: (user.get('address') or {}).get('street', ''),
+    'company.name': lambda user: (user.get('company') or {}).get('name', ''),
+    'company.catchPhrase': lambda user: (user.get('company') or {}).get('catchPhrase', ''),
+}
+
+# In-memory cache (loads once at startup, shared with the other routers)
+users_data = get_users()
+
+# Precomputed indexes over users_data (read-only, aligned by row index)
+FLAT_USERS = [flatten_user_data(user) for user in users_data]
+COLUMNS = build_columns(users_data, FLAT_USERS)
+
+# Lowercased text of each column for substring filters ('id' is excluded
+# because filters compare it after integer conversion)
+LOWER_COLUMNS = {
+    key: [None if value is None else str(value).lower() for value in column]
+    for key, column in COLUMNS.items() if key != 'id'
+}
+TEXT_COLUMNS = {
+    field: [str(get(user)).lower() for user in users_data]
+    for field, get in TEXT_FIELDS.items()
+}
+
+# One lowercased, tab-separated haystack per user so search is a single
+# substring test per row (a term without a tab cannot span two fields;
+# search_rows checks terms containing a tab field by field)
+HAYSTACKS = ["\t".join(values) for values in zip(*TEXT_COLUMNS.values())]
+
+def build_search_blob(haystacks: List[str]) -> Tuple[bytes, List[int], List[int]]:
+    """Pack the haystacks into one bytes buffer; returns (blob, row starts, row ends)"""
+    encoded = [haystack.encode('utf-8') for haystack in haystacks]
+    starts, ends, offset = [], [], 0
+    for chunk in encoded:
+        starts.append(offset)
+        ends.append(offset + len(chunk))
+        offset += len(chunk) + 1
+    return b'\x1f'.join(encoded), starts, ends
+
+# All haystacks in one contiguous buffer so search is a few bytes.find calls
+SEARCH_BLOB, ROW_STARTS, ROW_ENDS = build_search_blob(HAYSTACKS)
+
+def find_chunks(blob: bytes, starts: List[int], ends: List[int], needle: bytes) -> List[int]:
+    """Return the indexes of the packed chunks that contain needle, in order"""
+    chunks: List[int] = []
+    pos = blob.find(needle)
+    while pos != -1:
+        chunk = bisect_right(starts, pos) - 1
+        if pos + len(needle) <= ends[chunk]:
+            # Hit inside this chunk; resume scanning at the next one
+            chunks.append(chunk)
+            pos = blob.find(needle, ends[chunk] + 1)
+        else:
+            # Hit spans the chunk separator; keep looking
+            pos = blob.find(needle, pos + 1)
+    return chunks
+
+WORD_RE = re.compile(r"\w+")
+
+def build_token_index(haystacks: List[str]) -> Dict[str, List[int]]:
+    """Map each word token of the haystacks to the (ascending) rows containing it"""
+    index: Dict[str, List[int]] = {}
+    for row, haystack in enumerate(haystacks):
+        for token in set(WORD_RE.findall(haystack)):
+            index.setdefault(token, []).append(row)
+    return index
+
+# Inverted index over the distinct word tokens, with the vocabulary packed
+# like the haystacks so a word query scans each distinct token only once
+TOKEN_INDEX = build_token_index(HAYSTACKS)
+TOKEN_ROWS = list(TOKEN_INDEX.values())
+TOKEN_BLOB, TOKEN_STARTS, TOKEN_ENDS = build_search_blob(list(TOKEN_INDEX))
+
+def search_rows(search_lower: str) -> List[int]:
+    """Return the indexes of rows whose haystack contains the (lowercased) search term"""
+    if WORD_RE.fullmatch(search_lower):
+        # A run of word characters can only match inside a single token
+        exact = TOKEN_INDEX.get(search_lower)
+        tokens = find_chunks(TOKEN_BLOB, TOKEN_STARTS, TOKEN_ENDS, search_lower.encode('utf-8'))
+        if len(tokens) == 1 and exact is not None:
+            return exact
+        rows: Set[int] = set()
+        for token in tokens:
+            rows.update(TOKEN_ROWS[token])
+        return sorted(rows)
+    if '\t' in search_lower:
+        # The term could straddle the field separator, so test each field
+        columns = list(TEXT_COLUMNS.values())
+        return [
+            i for i in range(len(users_data))
+            if any(search_lower in column[i] for column in columns)
+        ]
+    return find_chunks(SEARCH_BLOB, ROW_STARTS, ROW_ENDS, search_lower.encode('utf-8'))
+
+# id -> user lookup for single-user requests (first occurrence wins, as with a linear scan)
+USERS_BY_ID = {user["id"]: user for user in reversed(users_data) if "id" in user}
+
+# Encoded body and ETag of each user that has passed User validation,
+# filled on first request (only known ids are ever stored)
+USER_RESPONSES: Dict[int, Tuple[bytes, str]] = {}
+
+# Precomputed sort keys per accepted sort_by value (ids raw, text lowercased)
+SORT_KEYS = {
+    'id': [user.get('id', 0) for user in users_data],
+    'name': TEXT_COLUMNS['name'],
+    'username': TEXT_COLUMNS['username'],
+    'email': TEXT_COLUMNS['email'],
+    'phone': TEXT_COLUMNS['phone'],
+    'website': TEXT_COLUMNS['website'],
+    'city': TEXT_COLUMNS['address.city'],
+    'address.city': TEXT_COLUMNS['address.city'],
+    'street': TEXT_COLUMNS['address.street'],
+    'address.street': TEXT_COLUMNS['address.street'],
+    'company': TEXT_COLUMNS['company.name'],
+    'company.name': TEXT_COLUMNS['company.name'],
+    'company.catchPhrase': TEXT_COLUMNS['company.catchPhrase'],
+}
+
+# Inverted indexes for equality/substring filters on common keys
+BY_ID = build_inverted_index(COLUMNS.get('id', []), as_int)
+BY_CITY = build_inverted_index(COLUMNS['address.city'], lambda value: str(value).lower())
+BY_COMPANY = build_inverted_index(COLUMNS['company.name'], lambda value: str(value).lower())
+TEXT_INDEXES = {
+    'city': BY_CITY,
+    'address.city': BY_CITY,
+    'company_name': BY_COMPANY,
+    'company.name': BY_COMPANY,
+}
+
+def indexed_rows(constraint: Dict[str, Any]) -> Optional[Set[int]]:
+    """Resolve a filter constraint through the inverted indexes (None if it needs a row scan)"""
+    kind, value = constraint['type'], constraint.get('value')
+    is_equality = kind == 'op' and constraint['op'] in ('==', '=')
+    
+    if constraint['key'] == 'id':
+        # Numeric equality (default and ==/= behave the same for numbers)
+        if (kind == 'default' or is_equality) and isinstance(value, (int, float)):
+            return set(BY_ID.get(value, ()))
+        return None
+    
+    index = TEXT_INDEXES.get(constraint['key'])
+    if index is None or not isinstance(value, str):
+        return None
+    
+    needle = value.lower()
+    if is_equality and needle:
+        return set(index.get(needle, ()))
+    if kind == 'default':
+        # Substring match only needs to scan the distinct values
+        return {i for text, rows in index.items() if needle in text for i in rows}
+    return None
+
+# Filter operators, keyed by their text
+FILTER_OPS_2 = {'>=': '>=', '<=': '<=', '!=': '!=', '==': '=='}
+FILTER_OPS_1 = {'>': '>', '<': '<', '=': '='}
+
+def parse_iso_date(s: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date/datetime, or return None"""
+    try:
+        # Support 'Z' suffix (UTC)
+        if s.endswith('Z'):
+            s = s[:-1] + '+00:00'
+        return datetime.fromisoformat(s)
+    except Exception:
+        return None
+
+def coerce(s: str):
+    """Coerce a filter value to int, float or datetime, falling back to the string"""
+    # Try int/float
+    try:
+        if '.' in s:
+            return float(s)
+        return int(s)
+    except Exception:
+        pass
+    # Try ISO datetime
+    dt = parse_iso_date(s)
+    if dt is not None:
+        return dt
+    # Fallback to string (case-insensitive compare later)
+    return s
+
+def compare(a, b, op: str) -> bool:
+    """Apply a comparison operator to two filter values"""
+    # Normalize types: if both numeric/date -> compare; else compare as strings
+    if isinstance(a, (int, float, datetime)) and isinstance(b, (int, float, datetime)):
+        if op == '>':  return a > b
+        if op == '>=': return a >= b
+        if op == '<':  return a < b
+        if op == '<=': return a <= b
+        if op in ('==', '='): return a == b
+        if op == '!=': return a != b
+        return False
+    # String comparisons
+    a_s, b_s = str(a).lower(), str(b).lower()
+    if op in ('==', '='):   return a_s == b_s
+    if op == '!=':          return a_s != b_s
+    # For non-equality with strings, default to substring semantics
+    # Treat '>' '<' etc. as substring check not applicable; return False
+    return False
+
+def constraint_ok(i: int, c: Dict[str, Any]) -> bool:
+    """Check whether row i satisfies a parsed filter constraint"""
+    # Resolve value via the column index (flat or nested key),
+    # falling back to a nested walk for ad-hoc paths
+    column = COLUMNS.get(c['key'])
+    if column is not None:
+        target = column[i]
+    elif '.' in c['key']:
+        target = get_nested_value(users_data[i], c['key'])
+    else:
+        target = None
+
+    # Special-case id as numeric if possible for convenience
+    if c['key'] == 'id' and target is not None:
+        try:
+            target = int(target)
+        except Exception:
+            pass
+
+    if c['type'] == 'range':
+        low, high = c['low'], c['high']
+        # If target is string, try to coerce similarly
+        t = target if not isinstance(target, str) else coerce(target)
+        # Only compare if types are comparable
+        if isinstance(t, (int, float, datetime)) and isinstance(low, type(t)) and isinstance(high, type(t)):
+            return low <= t <= high
+        return False
+
+    if c['type'] == 'op':
+        t = target if not isinstance(target, str) else coerce(target)
+        # If coercion yields different types, comparison may fail; compare strings if needed
+        if isinstance(t, (int, float, datetime)) and isinstance(c['value'], (int, float, datetime)):
+            return compare(t, c['value'], c['op'])
+        return compare(str(target or ''), str(c['value']), c['op'])
+
+    # Default
+    v = c['value']
+    if isinstance(v, (int, float, datetime)):
+        # equality for non-strings
+        t = target if not isinstance(target, str) else coerce(target)
+        return t == v
+    # substring match for strings (needle lowered once in parse_filters)
+    lowered = LOWER_COLUMNS.get(c['key'])
+    if lowered is not None:
+        text = lowered[i]
+        return text is not None and c['needle'] in text
+    return target is not None and c['needle'] in str(target).lower()
+
+@lru_cache(maxsize=128)
+def parse_filters(filters: str) -> Tuple[Dict[str, Any], ...]:
+    """Parse a filters string into constraints (memoized; callers must not mutate them)
+
+    Syntax supported:
+      key:value         -> substring (strings) or equality (numbers/dates)
+      key:==value       -> equality
+      key:!=value       -> inequality
+      key:>value, >=, <, <=
+      key:a..b          -> inclusive range (numbers/dates)
+    """
+    filter_pairs = [pair.strip() for pair in filters.split(',') if pair.strip()]
+
+    constraints: List[Dict[str, Any]] = []
+    for pair in filter_pairs:
+        if ':' not in pair:
+            continue
+        key, raw = pair.split(':', 1)
+        key = key.strip()
+        raw = raw.strip()
+
+        # Range "a..b"
+        if '..' in raw:
+            left, right = raw.split('..', 1)
+            left, right = left.strip(), right.strip()
+            left_v, right_v = coerce(left), coerce(right)
+            constraints.append({'key': key, 'type': 'range', 'low': left_v, 'high': right_v})
+            continue
+
+        # Operators (two-character operators take precedence)
+        op = FILTER_OPS_2.get(raw[:2]) or FILTER_OPS_1.get(raw[:1])
+        if op:
+            value = raw[len(op):].strip()
+            constraints.append({'key': key, 'type': 'op', 'op': op, 'value': coerce(value)})
+        else:
+            # Default: substring/equality
+            value = coerce(raw)
+            constraint = {'key': key, 'type': 'default', 'value': value}
+            if isinstance(value, str):
+                constraint['needle'] = value.lower()
+            constraints.append(constraint)
+
+    return tuple(constraints)
+
+def stream_payload(
+    rows: Iterable[Dict[str, Any]],
+    columns: List[str],
+    total: int,
+    pagination: Optional[Dict[str, Any]],
+    format_type: str
+) -> Iterator[bytes]:
+    """Yield the flexible data response as JSON chunks, one row at a time"""
+    yield b'{"data":['
+    for i, row in enumerate(rows):
+        yield (b',' + orjson.dumps(row)) if i else orjson.dumps(row)
+    # Close the array and append the remaining envelope fields
+    yield b'],' + orjson.dumps({
+        "columns": columns,
+        "total": total,
+        "pagination": pagination,
+        "format": format_type
+    })[1:]
+
+def query_users(
+    columns: Optional[str],
+    page: Optional[int],
+    limit: Optional[int],
+    search: Optional[str],
+    filters: Optional[str],
+    sort_by: Optional[str],
+    sort_order: Optional[str],
+    format_type: str
+) -> Tuple[Iterator[Dict[str, Any]], List[str], int, Optional[Dict[str, Any]]]:
+    """Run search/filter/sort/paginate; returns (lazy rows, columns, total, pagination)"""
+    # Row indexes into users_data carried through search/filter/sort/paginate;
+    # rows are only materialized for the final page
+    filtered_idx = range(len(users_data))
     
     # Apply search filter (include id)
     if search:
         search_lower = search.lower()
-        filtered_data = [
-            user for user in filtered_data
-            if any(
-                search_lower in str(value).lower()
-                for value in [
-                    str(user.get('id', '')),
-                    user.get('name', ''),
-                    user.get('username', ''),
-                    user.get('email', ''),
-                    user.get('phone', ''),
-                    user.get('website', ''),
-                    user.get('address', {}).get('city', ''),
-                    user.get('address', {}).get('street', ''),
-                    user.get('company', {}).get('name', ''),
-                    user.get('company', {}).get('catchPhrase', '')
-                ]
-            )
-        ]
+        filtered_idx = search_rows(search_lower)
 
     # Apply column-specific filters (supports operators and ranges)
     if filters:
-        def get_nested_value(obj: Dict[str, Any], path: str):
-            try:
-                current = obj
-                for part in path.split('.'):
-                    if isinstance(current, dict) and part in current:
-                        current = current[part]
-                    else:
-                        return None
-                return current
-            except Exception:
-                return None
+        constraints = parse_filters(filters)
 
-        def parse_iso_date(s: str) -> Optional[datetime]:
-            try:
-                # Support 'Z' suffix (UTC)
-                if s.endswith('Z'):
-                    s = s[:-1] + '+00:00'
-                return datetime.fromisoformat(s)
-            except Exception:
-                return None
-
-        def coerce(s: str):
-            # Try int/float
-            try:
-                if '.' in s:
-                    return float(s)
-                return int(s)
-            except Exception:
-                pass
-            # Try ISO datetime
-            dt = parse_iso_date(s)
-            if dt is not None:
-                return dt
-            # Fallback to string (case-insensitive compare later)
-            return s
-
-        def compare(a, b, op: str) -> bool:
-            # Normalize types: if both numeric/date -> compare; else compare as strings
-            if isinstance(a, (int, float, datetime)) and isinstance(b, (int, float, datetime)):
-                if op == '>':  return a > b
-                if op == '>=': return a >= b
-                if op == '<':  return a < b
-                if op == '<=': return a <= b
-                if op in ('==', '='): return a == b
-                if op == '!=': return a != b
-                return False
-            # String comparisons
-            a_s, b_s = str(a).lower(), str(b).lower()
-            if op in ('==', '='):   return a_s == b_s
-            if op == '!=':          return a_s != b_s
-            # For non-equality with strings, default to substring semantics
-            # Treat '>' '<' etc. as substring check not applicable; return False
-            return False
-
-        # Parse filters string into list of constraints
-        # Syntax supported:
-        #   key:value         -> substring (strings) or equality (numbers/dates)
-        #   key:==value       -> equality
-        #   key:!=value       -> inequality
-        #   key:>value, >=, <, <=
-        #   key:a..b          -> inclusive range (numbers/dates)
-        filter_pairs = [pair.strip() for pair in filters.split(',') if pair.strip()]
-
-        constraints: List[Dict[str, Any]] = []
-        for pair in filter_pairs:
-            if ':' not in pair:
-                continue
-            key, raw = pair.split(':', 1)
-            key = key.strip()
-            raw = raw.strip()
-
-            # Range "a..b"
-            if '..' in raw:
-                left, right = raw.split('..', 1)
-                left, right = left.strip(), right.strip()
-                left_v, right_v = coerce(left), coerce(right)
-                constraints.append({'key': key, 'type': 'range', 'low': left_v, 'high': right_v})
-                continue
-
-            # Operators
-            for op in ('>=', '<=', '!=', '>', '<', '==', '='):
-                if raw.startswith(op):
-                    value = raw[len(op):].strip()
-                    constraints.append({'key': key, 'type': 'op', 'op': op, 'value': coerce(value)})
-                    break
+        # Narrow candidates through the inverted indexes first
+        candidates: Optional[Set[int]] = None
+        remaining: List[Dict[str, Any]] = []
+        for c in constraints:
+            rows = indexed_rows(c)
+            if rows is None:
+                remaining.append(c)
             else:
-                # Default: substring/equality
-                constraints.append({'key': key, 'type': 'default', 'value': coerce(raw)})
+                candidates = rows if candidates is None else candidates & rows
+        
+        if candidates is not None:
+            filtered_idx = [i for i in filtered_idx if i in candidates]
+        constraints = remaining
 
         if constraints:
-            new_filtered = []
-            for user in filtered_data:
-                flat = flatten_user_data(user)
-
-                ok = True
-                for c in constraints:
-                    # Resolve value via nested key (a.b) or flat key
-                    if '.' in c['key']:
-                        target = get_nested_value(user, c['key'])
-                    else:
-                        target = flat.get(c['key'])
-
-                    # Special-case id as numeric if possible for convenience
-                    if c['key'] == 'id' and target is not None:
-                        try:
-                            target = int(target)
-                        except Exception:
-                            pass
-
-                    if c['type'] == 'range':
-                        low, high = c['low'], c['high']
-                        # If target is string, try to coerce similarly
-                        t = target if not isinstance(target, str) else coerce(target)
-                        # Only compare if types are comparable
-                        if isinstance(t, (int, float, datetime)) and isinstance(low, type(t)) and isinstance(high, type(t)):
-                            if not (low <= t <= high):
-                                ok = False
-                                break
-                        else:
-                            ok = False
-                            break
-
-                    elif c['type'] == 'op':
-                        t = target if not isinstance(target, str) else coerce(target)
-                        # If coercion yields different types, comparison may fail; compare strings if needed
-                        if isinstance(t, (int, float, datetime)) and isinstance(c['value'], (int, float, datetime)):
-                            if not compare(t, c['value'], c['op']):
-                                ok = False
-                                break
-                        else:
-                            if not compare(str(target or ''), str(c['value']), c['op']):
-                                ok = False
-                                break
-
-                    else:  # default
-                        v = c['value']
-                        if isinstance(v, (int, float, datetime)):
-                            # equality for non-strings
-                            t = target if not isinstance(target, str) else coerce(target)
-                            if t != v:
-                                ok = False
-                                break
-                        else:
-                            # substring match for strings
-                            if target is None or str(v).lower() not in str(target).lower():
-                                ok = False
-                                break
-
-                if ok:
-                    new_filtered.append(user)
-
-            filtered_data = new_filtered
+            filtered_idx = [
+                i for i in filtered_idx
+                if all(constraint_ok(i, c) for c in constraints)
+            ]
     
     # Apply sorting
     if sort_by:
         try:
             reverse = sort_order == "desc"
             
-            # Direct field sorting
-            if sort_by in ['id', 'name', 'username', 'email', 'phone', 'website']:
-                if sort_by == 'id':
-                    filtered_data.sort(key=lambda x: x.get('id', 0), reverse=reverse)
-                else:
-                    filtered_data.sort(key=lambda x: str(x.get(sort_by, '')).lower(), reverse=reverse)
-            
-            # Nested field sorting
-            elif sort_by == 'city' or sort_by == 'address.city':
-                filtered_data.sort(key=lambda x: str(x.get('address', {}).get('city', '')).lower(), reverse=reverse)
-            elif sort_by == 'street' or sort_by == 'address.street':
-                filtered_data.sort(key=lambda x: str(x.get('address', {}).get('street', '')).lower(), reverse=reverse)
-            elif sort_by == 'company' or sort_by == 'company.name':
-                filtered_data.sort(key=lambda x: str(x.get('company', {}).get('name', '')).lower(), reverse=reverse)
-            elif sort_by == 'company.catchPhrase':
-                filtered_data.sort(key=lambda x: str(x.get('company', {}).get('catchPhrase', '')).lower(), reverse=reverse)
+            sort_keys = SORT_KEYS.get(sort_by)
+            if sort_keys is not None:
+                filtered_idx = sorted(filtered_idx, key=sort_keys.__getitem__, reverse=reverse)
                 
         except Exception as e:
             # If sorting fails, continue without sorting
             print(f"Sorting error: {e}")
     
-    total_count = len(filtered_data)
+    total_count = len(filtered_idx)
     
     # Parse columns
     selected_columns = None
     if columns:
         selected_columns = [col.strip() for col in columns.split(',')]
     
-    # Apply column selection
-    selected_data = select_columns(filtered_data, selected_columns, format)
-    
-    # Apply pagination
+    # Apply pagination on the row indexes
     pagination_info = None
     if page is not None and limit is not None:
         start_index = (page - 1) * limit
         end_index = start_index + limit
-        paginated_data = selected_data[start_index:end_index]
+        filtered_idx = filtered_idx[start_index:end_index]
         
         pagination_info = {
             "page": page,
@@ -284,29 +457,103 @@ async def get_flexible_data(
             "has_next": end_index < total_count,
             "has_prev": page > 1
         }
-        
-        selected_data = paginated_data
+    
+    # Materialize only the returned rows (flat responses read the
+    # precomputed FLAT_USERS instead of re-flattening) and select columns
+    source = FLAT_USERS if format_type == "flat" else users_data
+    page_rows = (source[i] for i in filtered_idx)
+    if selected_columns:
+        project = make_row_projector(tuple(selected_columns), format_type)
+        selected_rows = map(project, page_rows)
+    else:
+        selected_rows = page_rows
     
     # Determine which columns are included
     if selected_columns:
         included_columns = selected_columns
     else:
         # All columns included
-        if format == "flat":
+        if format_type == "flat":
             included_columns = list(get_available_columns().keys())
         else:
             included_columns = ["id", "name", "username", "email", "address", "phone", "website", "company"]
     
-    return FlexibleDataResponse(
-        data=selected_data,
-        columns=included_columns,
-        total=total_count,
-        pagination=pagination_info,
-        format=format
+    return selected_rows, included_columns, total_count, pagination_info
+
+@lru_cache(maxsize=256)
+def render_users(
+    columns: Optional[str],
+    page: Optional[int],
+    limit: Optional[int],
+    search: Optional[str],
+    filters: Optional[str],
+    sort_by: Optional[str],
+    sort_order: Optional[str],
+    format_type: str
+) -> Tuple[bytes, str]:
+    """Run a query and encode the response body, memoized on the query arguments.
+
+    users_data is read-only, so a given query always produces the same bytes.
+    """
+    rows, included_columns, total_count, pagination_info = query_users(
+        columns, page, limit, search, filters, sort_by, sort_order, format_type
     )
+    body = orjson.dumps({
+        "data": list(rows),
+        "columns": included_columns,
+        "total": total_count,
+        "pagination": pagination_info,
+        "format": format_type
+    })
+    return body, make_etag(body)
+
+# The response models below are OpenAPI hints only: handlers return pre-encoded
+# JSON, so Pydantic never validates or serializes the outbound data
+@router.get("/", response_model=None, responses={200: {"model": FlexibleDataResponse}})
+def get_flexible_data(
+    columns: Optional[str] = Query(None, description="Comma-separated list of columns (e.g., 'id,name,email' or 'id,name,address.city')"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (1-based)"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Items per page"),
+    search: Optional[str] = Query(None, description="Search term to filter across all fields"),
+    filters: Optional[str] = Query(None, description="Comma-separated column filters in the form key:value (e.g., 'id:5,company.name:tech')"),
+    sort_by: Optional[str] = Query(None, description="Field to sort by (e.g., 'name', 'city', 'company.name')"),
+    sort_order: Optional[str] = Query("asc", pattern="^(asc|desc)$", description="Sort order: 'asc' or 'desc'"),
+    format: Optional[str] = Query("nested", pattern="^(nested|flat)$", description="Response format: 'nested' (preserves structure) or 'flat' (flattened)"),
+    stream: bool = Query(False, description="Stream the JSON response row by row instead of buffering it"),
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
+    """
+    Get user data with flexible column selection and filtering
+    
+    **Examples:**
+    - All data: `/api/data/`
+    - Basic info: `/api/data/?columns=id,name,email`
+    - Address only: `/api/data/?columns=id,name,address.street,address.city`
+    - Company info: `/api/data/?columns=id,name,company.name,company.catchPhrase`
+    - Flat format: `/api/data/?columns=id,name,city,company_name&format=flat`
+    - Search: `/api/data/?search=john&columns=id,name,email`
+    - Paginated: `/api/data/?columns=id,name,email&page=1&limit=10`
+    - Streamed: `/api/data/?stream=true`
+    
+    Buffered responses are cached per query and carry an `ETag`; send it back
+    in `If-None-Match` to get a `304 Not Modified`.
+    """
+    # Declared sync on purpose: the query pipeline is pure CPU work, so
+    # FastAPI runs it in the threadpool instead of on the event loop
+    if stream:
+        rows, included_columns, total_count, pagination_info = query_users(
+            columns, page, limit, search, filters, sort_by, sort_order, format
+        )
+        return StreamingResponse(
+            stream_payload(rows, included_columns, total_count, pagination_info, format),
+            media_type="application/json"
+        )
+    
+    body, etag = render_users(columns, page, limit, search, filters, sort_by, sort_order, format)
+    return cached_json_response(body, etag, if_none_match)
 
-@router.post("/", response_model=FlexibleDataResponse)
-async def get_flexible_data_post(request: DataRequest) -> FlexibleDataResponse:
+@router.post("/", response_model=None, responses={200: {"model": FlexibleDataResponse}})
+def get_flexible_data_post(request: DataRequest) -> Response:
     """
     POST version for complex column selection (useful when URL gets too long)
     
@@ -330,55 +577,62 @@ async def get_flexible_data_post(request: DataRequest) -> FlexibleDataResponse:
         columns_str = ",".join([col.value for col in request.columns])
     
     # Use the same logic as GET endpoint
-    return await get_flexible_data(
-        columns=columns_str,
-        page=request.page,
-        limit=request.limit,
-        search=request.search,
-        sort_by=request.sort_by,
-        sort_order=request.sort_order,
-        format=request.format
+    body, etag = render_users(
+        columns_str, request.page, request.limit, request.search,
+        None, request.sort_by, request.sort_order, request.format
     )
+    return cached_json_response(body, etag)
 
-@router.get("/{user_id}", response_model=User)
-async def get_user_by_id(user_id: int) -> User:
+@router.get("/{user_id}", response_model=None, responses={200: {"model": User}})
+async def get_user_by_id(
+    user_id: int,
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
     """Get a specific user by ID"""
-    user = next((user for user in users_data if user["id"] == user_id), None)
-    if not user:
-        raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
+    cached = USER_RESPONSES.get(user_id)
+    if cached is None:
+        user = USERS_BY_ID.get(user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail=f"User with ID {user_id} not found")
+        
+        # Validate the user data against the User model (once per user) and
+        # encode it straight from pydantic-core, without an intermediate dict
+        try:
+            body = User.model_validate(user).model_dump_json().encode()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Invalid user data: {str(e)}")
+        
+        cached = USER_RESPONSES[user_id] = (body, make_etag(body))
     
-    # Validate the user data against the User model
-    try:
-        return User(**user)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Invalid user data: {str(e)}")
+    return cached_json_response(*cached, if_none_match)
 
-@router.get("/search/")
-async def search_users(
+@router.get("/search/", response_model=None, responses={200: {"model": FlexibleDataResponse}})
+def search_users(
     q: str = Query(..., description="Search query"),
     columns: Optional[str] = Query(None, description="Comma-separated list of columns to return"),
-    format: Optional[str] = Query("nested", pattern="^(nested|flat)$", description="Response format")
-) -> FlexibleDataResponse:
+    format: Optional[str] = Query("nested", pattern="^(nested|flat)$", description="Response format"),
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
     """
     Search users by name, email, username, etc. with column selection
     
     **Examples:**
     - Basic search: `/api/data/search/?q=john`
     - Search with columns: `/api/data/search/?q=tech&columns=id,name,company.name`
+    
+    Responses carry an `ETag`; send it back in `If-None-Match` to get a
+    `304 Not Modified`.
     """
     
     if not q:
-        return FlexibleDataResponse(
-            data=[],
-            columns=[],
-            total=0,
-            pagination=None,
-            format=format
-        )
+        return ORJSONResponse({
+            "data": [],
+            "columns": [],
+            "total": 0,
+            "pagination": None,
+            "format": format
+        })
     
-    # Use the main get_flexible_data function with search parameter
-    return await get_flexible_data(
-        columns=columns,
-        search=q,
-        format=format
-    )
+    # Use the same logic as the main data endpoint with search parameter
+    body, etag = render_users(columns, None, None, q, None, None, "asc", format)
+    return cached_json_response(body, etag, if_none_match)
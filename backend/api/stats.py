@@ -1,56 +1,33 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from typing import Dict, Any, List
-import json
-from pathlib import Path
 from collections import Counter
+import orjson
 
 from ..models import StatsResponse
+from ..data_store import get_users
 
 router = APIRouter(prefix="/api/stats", tags=["statistics"])
 
-# Load data function (same as in data.py)
-def load_data() -> List[Dict[str, Any]]:
-    """Load data from the JSON file"""
-    try:
-        current_dir = Path(__file__).parent.parent.parent
-        data_file = current_dir / "dummy_db" / "data.json"
-        
-        with open(data_file, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        return data
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
-
-users_data = load_data()
+users_data = get_users()
 
-@router.get("/", response_model=StatsResponse)
-async def get_stats() -> StatsResponse:
-    """
-    Get comprehensive statistics about the user data
-    
-    **Returns:**
-    - Total number of users
-    - Unique cities, companies, email domains
-    - Lists of all unique values
-    """
-    
+def compute_stats(users_data: List[Dict[str, Any]]) -> StatsResponse:
+    """Compute unique cities, companies and email domains"""
     cities = set()
     companies = set()
     domains = set()
     
     for user in users_data:
         # Collect cities
-        if user.get('address', {}).get('city'):
+        if (user.get('address') or {}).get('city'):
             cities.add(user['address']['city'])
         
         # Collect companies
-        if user.get('company', {}).get('name'):
+        if (user.get('company') or {}).get('name'):
             companies.add(user['company']['name'])
         
         # Collect email domains
         if user.get('email'):
-            domain = user['email'].split('@')[-1]
-            domains.add(domain)
+            domains.add(user['email'].rpartition('@')[2])
     
     return StatsResponse(
         total_users=len(users_data),
@@ -62,35 +39,40 @@ async def get_stats() -> StatsResponse:
         email_domains=sorted(list(domains))
     )
 
-@router.get("/summary")
-async def get_data_summary() -> Dict[str, Any]:
-    """
-    Get a quick summary of the data for dashboard purposes
-    """
-    
-    # Count distributions
+def compute_summary(users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute value distributions and data quality counts"""
+    # Count distributions and data quality in a single pass
     city_counts = Counter()
     company_counts = Counter()
     domain_counts = Counter()
+    with_address = with_company = with_email = with_phone = 0
     
     for user in users_data:
-        if user.get('address', {}).get('city'):
-            city_counts[user['address']['city']] += 1
+        address = user.get('address') or {}
+        company = user.get('company') or {}
+        email = user.get('email')
         
-        if user.get('company', {}).get('name'):
-            company_counts[user['company']['name']] += 1
+        if address.get('city'):
+            city_counts[address['city']] += 1
         
-        if user.get('email'):
-            domain = user['email'].split('@')[-1]
-            domain_counts[domain] += 1
+        if company.get('name'):
+            company_counts[company['name']] += 1
+        
+        if email:
+            domain_counts[email.rpartition('@')[2]] += 1
+        
+        with_address += bool(address)
+        with_company += bool(company)
+        with_email += bool(email)
+        with_phone += bool(user.get('phone'))
     
     return {
         "total_users": len(users_data),
         "data_quality": {
-            "users_with_address": sum(1 for user in users_data if user.get('address')),
-            "users_with_company": sum(1 for user in users_data if user.get('company')),
-            "users_with_email": sum(1 for user in users_data if user.get('email')),
-            "users_with_phone": sum(1 for user in users_data if user.get('phone')),
+            "users_with_address": with_address,
+            "users_with_company": with_company,
+            "users_with_email": with_email,
+            "users_with_phone": with_phone,
         },
         "top_cities": dict(city_counts.most_common(5)),
         "top_companies": dict(company_counts.most_common(5)),
@@ -101,14 +83,12 @@ async def get_data_summary() -> Dict[str, Any]:
         }
     }
 
-@router.get("/cities")
-async def get_city_stats() -> Dict[str, Any]:
-    """Get detailed statistics about cities"""
-    
+def compute_city_stats(users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute per-city user, zipcode and company counts"""
     city_data = {}
     
     for user in users_data:
-        address = user.get('address', {})
+        address = user.get('address') or {}
         city = address.get('city')
         
         if city:
@@ -124,7 +104,7 @@ async def get_city_stats() -> Dict[str, Any]:
             if address.get('zipcode'):
                 city_data[city]['zipcodes'].add(address['zipcode'])
             
-            if user.get('company', {}).get('name'):
+            if (user.get('company') or {}).get('name'):
                 city_data[city]['companies'].add(user['company']['name'])
     
     # Convert sets to lists and sort
@@ -143,14 +123,12 @@ async def get_city_stats() -> Dict[str, Any]:
         "total_cities": len(result)
     }
 
-@router.get("/companies")
-async def get_company_stats() -> Dict[str, Any]:
-    """Get detailed statistics about companies"""
-    
+def compute_company_stats(users_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute per-company employee and city counts"""
     company_data = {}
     
     for user in users_data:
-        company = user.get('company', {})
+        company = user.get('company') or {}
         company_name = company.get('name')
         
         if company_name:
@@ -164,7 +142,7 @@ async def get_company_stats() -> Dict[str, Any]:
             
             company_data[company_name]['employee_count'] += 1
             
-            if user.get('address', {}).get('city'):
+            if (user.get('address') or {}).get('city'):
                 company_data[company_name]['cities'].add(user['address']['city'])
     
     # Convert sets to lists
@@ -182,3 +160,40 @@ async def get_company_stats() -> Dict[str, Any]:
         "companies": result,
         "total_companies": len(result)
     }
+
+# Precomputed, pre-encoded responses (users_data is read-only, so no
+# invalidation is needed). StatsResponse is validated once here and kept
+# as an OpenAPI hint only.
+_STATS_BYTES = orjson.dumps(compute_stats(users_data).model_dump())
+_SUMMARY_BYTES = orjson.dumps(compute_summary(users_data))
+_CITY_STATS_BYTES = orjson.dumps(compute_city_stats(users_data))
+_COMPANY_STATS_BYTES = orjson.dumps(compute_company_stats(users_data))
+
+@router.get("/", response_model=None, responses={200: {"model": StatsResponse}})
+async def get_stats() -> Response:
+    """
+    Get comprehensive statistics about the user data
+    
+    **Returns:**
+    - Total number of users
+    - Unique cities, companies, email domains
+    - Lists of all unique values
+    """
+    return Response(content=_STATS_BYTES, media_type="application/json")
+
+@router.get("/summary")
+async def get_data_summary() -> Response:
+    """
+    Get a quick summary of the data for dashboard purposes
+    """
+    return Response(content=_SUMMARY_BYTES, media_type="application/json")
+
+@router.get("/cities")
+async def get_city_stats() -> Response:
+    """Get detailed statistics about cities"""
+    return Response(content=_CITY_STATS_BYTES, media_type="application/json")
+
+@router.get("/companies")
+async def get_company_stats() -> Response:
+    """Get detailed statistics about companies"""
+    return Response(content=_COMPANY_STATS_BYTES, media_type="application/json")
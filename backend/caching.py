@@ -0,0 +1,26 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Response
+
+# Seconds a client may reuse a response before revalidating it with its ETag
+CACHE_MAX_AGE = 60
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag from a response body"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header value covers the given ETag"""
+    if not if_none_match:
+        return False
+    
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in tags or f"W/{etag}" in tags
+
+def cached_json_response(body: bytes, etag: str, if_none_match: Optional[str] = None) -> Response:
+    """Return pre-encoded JSON with caching headers, or a 304 if the client copy is current"""
+    headers = {"ETag": etag, "Cache-Control": f"max-age={CACHE_MAX_AGE}"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,37 @@
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any
+
+import orjson
+from fastapi import HTTPException
+
+# Path to the dummy database shipped with the repo
+DATA_PATH = Path(__file__).parent.parent / "dummy_db" / "data.json"
+
+# (parent key, field) pairs whose values repeat across users
+INTERNED_FIELDS = (
+    ("address", "city"),
+    ("company", "name"),
+)
+
+def intern_repeated_values(users: List[Dict[str, Any]]) -> None:
+    """Intern repeated string values in place so equal values share one object"""
+    for user in users:
+        for parent, field in INTERNED_FIELDS:
+            obj = user.get(parent)
+            if isinstance(obj, dict) and isinstance(obj.get(field), str):
+                obj[field] = sys.intern(obj[field])
+
+@lru_cache(maxsize=1)
+def get_users() -> List[Dict[str, Any]]:
+    """Load user data from the JSON file (parsed once per process and shared by all routers)"""
+    try:
+        users = orjson.loads(DATA_PATH.read_bytes())
+    except FileNotFoundError:
+        raise HTTPException(status_code=500, detail="Data file not found")
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=500, detail="Invalid JSON data")
+    if isinstance(users, list):
+        intern_repeated_values(users)
+    return users
@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from typing import Dict, Any
 import uvicorn
+import orjson
 
 
 # Import API routers
@@ -11,7 +14,8 @@ from .api.stats import router as stats_router
 app = FastAPI(
     title="Data Table API",
     description="FastAPI backend for the Data Table application with flexible column selection",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -28,19 +32,40 @@ app.include_router(data_router)
 app.include_router(columns_router)
 app.include_router(stats_router)
 
+# Schema examples live outside the models and are only loaded when the docs are built
+_build_openapi = app.openapi
+
+def openapi_with_examples() -> Dict[str, Any]:
+    """Build the OpenAPI schema once and attach the component schema examples"""
+    if app.openapi_schema:
+        return app.openapi_schema
+    from .openapi_examples import SCHEMA_EXAMPLES
+    
+    schema = _build_openapi()
+    components = schema.get("components", {}).get("schemas", {})
+    for name, example in SCHEMA_EXAMPLES.items():
+        if name in components:
+            components[name]["example"] = example
+    return schema
+
+app.openapi = openapi_with_examples
+
+# Health check body is static, so serialize it once
+_ROOT_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": "Data Table API v2.0",
+    "docs": "/docs",
+    "endpoints": {
+        "data": "/api/data/",
+        "columns": "/api/columns/",
+        "stats": "/api/stats/"
+    }
+})
+
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "Data Table API v2.0",
-        "docs": "/docs",
-        "endpoints": {
-            "data": "/api/data/",
-            "columns": "/api/columns/",
-            "stats": "/api/stats/"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 
@@ -0,0 +1,40 @@
+from typing import Dict, Any
+
+# Example payloads shown in the OpenAPI docs, keyed by component schema name.
+# Imported lazily by main.py the first time /openapi.json is built.
+GEO_LOCATION_EXAMPLE = {
+    "lat": "40.7128",
+    "lng": "-74.0060"
+}
+
+ADDRESS_EXAMPLE = {
+    "street": "Main Street",
+    "suite": "Apt. 101",
+    "city": "New York",
+    "zipcode": "10001",
+    "geo": GEO_LOCATION_EXAMPLE
+}
+
+COMPANY_EXAMPLE = {
+    "name": "Tech Solutions Inc",
+    "catchPhrase": "Innovative technology solutions",
+    "bs": "revolutionize digital experiences"
+}
+
+USER_EXAMPLE = {
+    "id": 1,
+    "name": "John Smith",
+    "username": "johnsmith",
+    "email": "john.smith@email.com",
+    "address": ADDRESS_EXAMPLE,
+    "phone": "1-555-123-4567 x1001",
+    "website": "johnsmith.dev",
+    "company": COMPANY_EXAMPLE
+}
+
+SCHEMA_EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "GeoLocation": GEO_LOCATION_EXAMPLE,
+    "Address": ADDRESS_EXAMPLE,
+    "Company": COMPANY_EXAMPLE,
+    "User": USER_EXAMPLE,
+}
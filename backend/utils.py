@@ -1,4 +1,40 @@
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Iterable, Iterator, Tuple, Callable
+from functools import lru_cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Nested column names and their flat-format keys
+_NESTED_TO_FLAT = {
+    "address.street": "street",
+    "address.suite": "suite",
+    "address.city": "city",
+    "address.zipcode": "zipcode",
+    "address.geo.lat": "lat",
+    "address.geo.lng": "lng",
+    "company.name": "company_name",
+    "company.catchPhrase": "company_catchphrase",
+    "company.bs": "company_bs",
+}
+
+# Nested column names -> (parent key, leaf key, intermediate key or None)
+_NESTED_PATHS = {
+    "address.street": ("address", "street", None),
+    "address.suite": ("address", "suite", None),
+    "address.city": ("address", "city", None),
+    "address.zipcode": ("address", "zipcode", None),
+    "address.geo.lat": ("address", "lat", "geo"),
+    "address.geo.lng": ("address", "lng", "geo"),
+    "company.name": ("company", "name", None),
+    "company.catchPhrase": ("company", "catchPhrase", None),
+    "company.bs": ("company", "bs", None),
+}
+
+# Local variable names (source object, output object) used by generated projectors
+_NESTED_VARS = {"address": ("a", "oa"), "company": ("c", "oc")}
+
+# Top-level (non-nested) user fields
+_BASIC_COLS = frozenset({"id", "name", "username", "email", "phone", "website"})
 
 def flatten_user_data(user: Dict[str, Any]) -> Dict[str, Any]:
     """Flatten nested user data for easier column selection"""
@@ -11,226 +47,217 @@ def flatten_user_data(user: Dict[str, Any]) -> Dict[str, Any]:
         "website": user.get("website"),
     }
     
-    # Flatten address
-    if "address" in user and user["address"]:
-        address = user["address"]
-        flattened.update({
-            "street": address.get("street"),
-            "suite": address.get("suite"),
-            "city": address.get("city"),
-            "zipcode": address.get("zipcode"),
-        })
+    # Flatten address (assign keys directly rather than via temporary dicts)
+    address = user.get("address")
+    if address:
+        flattened["street"] = address.get("street")
+        flattened["suite"] = address.get("suite")
+        flattened["city"] = address.get("city")
+        flattened["zipcode"] = address.get("zipcode")
         
         # Flatten geo coordinates
-        if "geo" in address and address["geo"]:
-            geo = address["geo"]
-            flattened.update({
-                "lat": geo.get("lat"),
-                "lng": geo.get("lng"),
-            })
+        geo = address.get("geo")
+        if geo:
+            flattened["lat"] = geo.get("lat")
+            flattened["lng"] = geo.get("lng")
     
     # Flatten company
-    if "company" in user and user["company"]:
-        company = user["company"]
-        flattened.update({
-            "company_name": company.get("name"),
-            "company_catchphrase": company.get("catchPhrase"),
-            "company_bs": company.get("bs"),
-        })
+    company = user.get("company")
+    if company:
+        flattened["company_name"] = company.get("name")
+        flattened["company_catchphrase"] = company.get("catchPhrase")
+        flattened["company_bs"] = company.get("bs")
     
     return flattened
 
-def select_columns(data: List[Dict[str, Any]], columns: Optional[List[str]], format_type: str = "nested") -> List[Dict[str, Any]]:
-    """Select specific columns from user data"""
+def select_columns(data: Iterable[Dict[str, Any]], columns: Optional[List[str]], format_type: str = "nested") -> Iterator[Dict[str, Any]]:
+    """Lazily select specific columns from user data, yielding one row at a time"""
+    if format_type == "flat":
+        return select_flat_columns((flatten_user_data(user) for user in data), columns)
+    return select_nested_columns(data, columns)
+
+def select_flat_columns(flat_data: Iterable[Dict[str, Any]], columns: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+    """Select specific columns from already-flattened user data"""
     if not columns:
         # Return all data if no columns specified
-        return data if format_type == "nested" else [flatten_user_data(user) for user in data]
+        yield from flat_data
+        return
     
-    selected_data = []
+    yield from map(make_row_projector(tuple(columns), "flat"), flat_data)
+
+def select_nested_columns(data: Iterable[Dict[str, Any]], columns: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+    """Select specific columns from nested user data"""
+    if not columns:
+        # Return all data if no columns specified
+        yield from data
+        return
     
-    for user in data:
-        if format_type == "flat":
-            # Use flattened data
-            flattened = flatten_user_data(user)
-            selected_user = {}
-            
-            for col in columns:
-                # Map nested column names to flat names
-                flat_col = col
-                if col == "address.street":
-                    flat_col = "street"
-                elif col == "address.suite":
-                    flat_col = "suite"
-                elif col == "address.city":
-                    flat_col = "city"
-                elif col == "address.zipcode":
-                    flat_col = "zipcode"
-                elif col == "address.geo.lat":
-                    flat_col = "lat"
-                elif col == "address.geo.lng":
-                    flat_col = "lng"
-                elif col == "company.name":
-                    flat_col = "company_name"
-                elif col == "company.catchPhrase":
-                    flat_col = "company_catchphrase"
-                elif col == "company.bs":
-                    flat_col = "company_bs"
-                
-                if flat_col in flattened and flattened[flat_col] is not None:
-                    selected_user[flat_col] = flattened[flat_col]
-            
-            selected_data.append(selected_user)
-        else:
-            # Use nested data structure
-            selected_user = {}
-            
-            for col in columns:
-                if col in ["id", "name", "username", "email", "phone", "website"]:
-                    if user.get(col) is not None:
-                        selected_user[col] = user.get(col)
-                
-                elif col.startswith("address."):
-                    if user.get("address"):
-                        if "address" not in selected_user:
-                            selected_user["address"] = {}
-                        
-                        if col == "address.street" and user["address"].get("street"):
-                            selected_user["address"]["street"] = user["address"]["street"]
-                        elif col == "address.suite" and user["address"].get("suite"):
-                            selected_user["address"]["suite"] = user["address"]["suite"]
-                        elif col == "address.city" and user["address"].get("city"):
-                            selected_user["address"]["city"] = user["address"]["city"]
-                        elif col == "address.zipcode" and user["address"].get("zipcode"):
-                            selected_user["address"]["zipcode"] = user["address"]["zipcode"]
-                        elif col == "address.geo.lat":
-                            geo = user["address"].get("geo", {})
-                            if geo.get("lat"):
-                                if "geo" not in selected_user["address"]:
-                                    selected_user["address"]["geo"] = {}
-                                selected_user["address"]["geo"]["lat"] = geo["lat"]
-                        elif col == "address.geo.lng":
-                            geo = user["address"].get("geo", {})
-                            if geo.get("lng"):
-                                if "geo" not in selected_user["address"]:
-                                    selected_user["address"]["geo"] = {}
-                                selected_user["address"]["geo"]["lng"] = geo["lng"]
-                
-                elif col.startswith("company."):
-                    if user.get("company"):
-                        # Only add the company object if we don't already have it
-                        if "company" not in selected_user:
-                            selected_user["company"] = {}
-                        
-                        # Only add the specific field that was requested
-                        if col == "company.name" and user["company"].get("name"):
-                            selected_user["company"]["name"] = user["company"]["name"]
-                        elif col == "company.catchPhrase" and user["company"].get("catchPhrase"):
-                            selected_user["company"]["catchPhrase"] = user["company"]["catchPhrase"]
-                        elif col == "company.bs" and user["company"].get("bs"):
-                            selected_user["company"]["bs"] = user["company"]["bs"]
-            
-            # Clean up empty nested objects
-            if "address" in selected_user and not selected_user["address"]:
-                del selected_user["address"]
-            if "company" in selected_user and not selected_user["company"]:
-                del selected_user["company"]
-            
-            selected_data.append(selected_user)
+    yield from map(make_row_projector(tuple(columns), "nested"), data)
+
+# Row projector code generation
+def _nested_projector_lines(columns: Tuple[str, ...]) -> List[str]:
+    """Emit the body of a nested-format row projector"""
+    lines = []
+    if any(col.startswith("address.") for col in columns):
+        lines.append("    a = u.get('address')")
+    if any(col.startswith("company.") for col in columns):
+        lines.append("    c = u.get('company')")
+    
+    for col in columns:
+        if col in _BASIC_COLS:
+            lines.append(f"    v = u.get({col!r})")
+            lines.append(f"    if v is not None: o[{col!r}] = v")
+        
+        elif col.startswith(("address.", "company.")):
+            # Unknown sub-fields still open (then drop) the empty nested object
+            parent = col.split(".", 1)[0]
+            src, dst = _NESTED_VARS[parent]
+            lines.append(f"    if {src}:")
+            lines.append(f"        {dst} = o.setdefault({parent!r}, {{}})")
+            spec = _NESTED_PATHS.get(col)
+            if spec is None:
+                continue
+            leaf, group = spec[1], spec[2]
+            if group:
+                lines.append(f"        g = {src}.get({group!r}, {{}})")
+                lines.append(f"        if g.get({leaf!r}): {dst}.setdefault({group!r}, {{}})[{leaf!r}] = g[{leaf!r}]")
+            else:
+                lines.append(f"        if {src}.get({leaf!r}): {dst}[{leaf!r}] = {src}[{leaf!r}]")
     
-    return selected_data
+    # Clean up empty nested objects
+    lines.append("    if 'address' in o and not o['address']: del o['address']")
+    lines.append("    if 'company' in o and not o['company']: del o['company']")
+    return lines
 
-def get_available_columns() -> Dict[str, str]:
-    """Get list of all available columns with descriptions"""
-    return {
-        "id": "User ID",
-        "name": "Full Name",
-        "username": "Username",
-        "email": "Email Address",
-        "phone": "Phone Number",
-        "website": "Website",
-        "address.street": "Street Address",
-        "address.suite": "Suite/Apartment",
-        "address.city": "City",
-        "address.zipcode": "ZIP Code",
-        "address.geo.lat": "Latitude",
-        "address.geo.lng": "Longitude",
-        "company.name": "Company Name",
-        "company.catchPhrase": "Company Slogan",
-        "company.bs": "Business Strategy"
-    }
+@lru_cache(maxsize=128)
+def make_row_projector(columns: Tuple[str, ...], format_type: str = "nested") -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compile a function that projects one row onto a fixed set of columns
 
-def validate_columns(columns: List[str]) -> List[str]:
-    """Validate that requested columns exist"""
-    available = set(get_available_columns().keys())
-    valid_columns = []
+    The per-column dispatch (flat key mapping, nested object creation and
+    cleanup of empty nested objects) is resolved once when the function is
+    generated instead of for every row. Column names are embedded with repr(),
+    so arbitrary client input is safe.
+    """
+    lines = ["def project(u):", "    o = {}"]
+    if format_type == "flat":
+        for col in columns:
+            key = _NESTED_TO_FLAT.get(col, col)
+            lines.append(f"    v = u.get({key!r})")
+            lines.append(f"    if v is not None: o[{key!r}] = v")
+    else:
+        lines.extend(_nested_projector_lines(columns))
+    lines.append("    return o")
     
-    for col in columns:
-        if col in available:
-            valid_columns.append(col)
-        else:
-            # Try to find partial matches for user-friendly error handling
-            print(f"Warning: Column '{col}' not found in available columns")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["project"]
+
+# Column metadata (module-level constants shared by every caller; do not mutate)
+_AVAILABLE_COLUMNS: Dict[str, str] = {
+    "id": "User ID",
+    "name": "Full Name",
+    "username": "Username",
+    "email": "Email Address",
+    "phone": "Phone Number",
+    "website": "Website",
+    "address.street": "Street Address",
+    "address.suite": "Suite/Apartment",
+    "address.city": "City",
+    "address.zipcode": "ZIP Code",
+    "address.geo.lat": "Latitude",
+    "address.geo.lng": "Longitude",
+    "company.name": "Company Name",
+    "company.catchPhrase": "Company Slogan",
+    "company.bs": "Business Strategy"
+}
+_AVAILABLE_COLUMN_NAMES = frozenset(_AVAILABLE_COLUMNS)
+
+_COLUMN_CATEGORIES: Dict[str, List[str]] = {
+    "basic": ["id", "name", "username", "email", "phone", "website"],
+    "address": [
+        "address.street", "address.suite", "address.city", 
+        "address.zipcode", "address.geo.lat", "address.geo.lng"
+    ],
+    "company": ["company.name", "company.catchPhrase", "company.bs"]
+}
+
+def get_available_columns() -> Dict[str, str]:
+    """Get list of all available columns with descriptions (shared, read-only)"""
+    return _AVAILABLE_COLUMNS
+
+def validate_columns(columns: List[str]) -> Tuple[List[str], List[str]]:
+    """Split requested columns into (valid, rejected)"""
+    valid_columns = [col for col in columns if col in _AVAILABLE_COLUMN_NAMES]
+    if len(valid_columns) == len(columns):
+        return valid_columns, []
     
-    return valid_columns
+    rejected = [col for col in columns if col not in _AVAILABLE_COLUMN_NAMES]
+    for col in rejected:
+        logger.debug("Column '%s' not found in available columns", col)
+    return valid_columns, rejected
 
 def get_column_categories() -> Dict[str, List[str]]:
-    """Get columns organized by categories"""
-    return {
-        "basic": ["id", "name", "username", "email", "phone", "website"],
-        "address": [
-            "address.street", "address.suite", "address.city", 
-            "address.zipcode", "address.geo.lat", "address.geo.lng"
-        ],
-        "company": ["company.name", "company.catchPhrase", "company.bs"]
-    }
+    """Get columns organized by categories (shared, read-only)"""
+    return _COLUMN_CATEGORIES
+
+def _searchable_values(user: Dict[str, Any]) -> List[Any]:
+    """Collect every searchable field of a user"""
+    # Search in direct fields
+    searchable_values = [
+        user.get('id', ''),
+        user.get('name', ''),
+        user.get('username', ''),
+        user.get('email', ''),
+        user.get('phone', ''),
+        user.get('website', '')
+    ]
+    
+    # Search in address fields
+    address = user.get('address')
+    if address:
+        searchable_values.extend([
+            address.get('street', ''),
+            address.get('suite', ''),
+            address.get('city', ''),
+            address.get('zipcode', '')
+        ])
+        
+        geo = address.get('geo')
+        if geo:
+            searchable_values.extend([geo.get('lat', ''), geo.get('lng', '')])
+    
+    # Search in company fields
+    company = user.get('company')
+    if company:
+        searchable_values.extend([
+            company.get('name', ''),
+            company.get('catchPhrase', ''),
+            company.get('bs', '')
+        ])
+    
+    return searchable_values
+
+def build_search_haystacks(data: List[Dict[str, Any]]) -> List[str]:
+    """Build one NUL-separated, lowercased haystack per user, aligned with data"""
+    return ["\x00".join(map(str, _searchable_values(user))).lower() for user in data]
+
+def search_in_data(data: List[Dict[str, Any]], search_term: str, haystacks: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Search for a term across all user data fields
 
-def search_in_data(data: List[Dict[str, Any]], search_term: str) -> List[Dict[str, Any]]:
-    """Search for a term across all user data fields"""
+    Pass the build_search_haystacks(data) result to reuse it across searches
+    of the same data set; it is rebuilt per call otherwise.
+    """
     if not search_term:
         return data
     
     search_lower = search_term.lower()
-    results = []
-    
-    for user in data:
-        # Search in direct fields
-        searchable_values = [
-            str(user.get('id', '')),
-            str(user.get('name', '')),
-            str(user.get('username', '')),
-            str(user.get('email', '')),
-            str(user.get('phone', '')),
-            str(user.get('website', ''))
+    if "\x00" in search_lower:
+        # The term could straddle the field separator, so test each field
+        return [
+            user for user in data
+            if any(search_lower in str(value).lower() for value in _searchable_values(user))
         ]
-        
-        # Search in address fields
-        if user.get('address'):
-            address = user['address']
-            searchable_values.extend([
-                str(address.get('street', '')),
-                str(address.get('suite', '')),
-                str(address.get('city', '')),
-                str(address.get('zipcode', ''))
-            ])
-            
-            if address.get('geo'):
-                geo = address['geo']
-                searchable_values.extend([
-                    str(geo.get('lat', '')),
-                    str(geo.get('lng', ''))
-                ])
-        
-        # Search in company fields
-        if user.get('company'):
-            company = user['company']
-            searchable_values.extend([
-                str(company.get('name', '')),
-                str(company.get('catchPhrase', '')),
-                str(company.get('bs', ''))
-            ])
-        
-        # Check if search term is found in any field
-        if any(search_lower in value.lower() for value in searchable_values):
-            results.append(user)
     
-    return results
\ No newline at end of file
+    if haystacks is None:
+        haystacks = build_search_haystacks(data)
+    return [user for user, haystack in zip(data, haystacks) if search_lower in haystack]